@@ -20,6 +20,10 @@ import threading
 import re
 
 
+# Seconds per duration suffix accepted by _parse_duration_to_seconds
+_DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
+
 class EchologRecorder:
     """Main recorder class that wraps ffmpeg for audio capture and segmentation."""
     
@@ -93,25 +97,16 @@ class EchologRecorder:
                 raise ValueError("time limit cannot be negative")
             return iv
         s_lower = s.lower()
+        multiplier = _DURATION_UNITS.get(s_lower[-1])
+        if multiplier is None:
+            raise ValueError(f"invalid time limit value: {value}")
         try:
-            if s_lower.endswith('s'):
-                base = int(s_lower[:-1])
-                if base < 0:
-                    raise ValueError
-                return base
-            if s_lower.endswith('m'):
-                base = int(s_lower[:-1])
-                if base < 0:
-                    raise ValueError
-                return base * 60
-            if s_lower.endswith('h'):
-                base = int(s_lower[:-1])
-                if base < 0:
-                    raise ValueError
-                return base * 3600
+            base = int(s_lower[:-1])
         except ValueError:
+            raise ValueError(f"invalid time limit value: {value}") from None
+        if base < 0:
             raise ValueError(f"invalid time limit value: {value}")
-        raise ValueError(f"invalid time limit value: {value}")
+        return base * multiplier
 
     def _start_limit_timer_if_needed(self) -> None:
         """Start background timer for warnings and auto-stop if a time limit is set."""
@@ -171,7 +166,17 @@ class EchologRecorder:
                             self.stop_recording(reason="time_limit")
                         finally:
                             return
-                time.sleep(0.2)
+                    # Waiting for the segment boundary needs fine-grained polling
+                    time.sleep(0.2)
+                    continue
+                # Sleep until the middle of the next warning's one-second window (or the
+                # limit itself) rather than polling at a fixed rate; cap so stops are noticed.
+                wake_at = limit_at
+                for w in warnings:
+                    target = limit_at - w - 0.5
+                    if w not in warned and now < target < wake_at:
+                        wake_at = target
+                time.sleep(min(1.0, max(0.05, wake_at - now)))
 
         try:
             self._limit_thread = threading.Thread(target=_runner, daemon=True)
@@ -527,13 +532,14 @@ class EchologRecorder:
                 if not line:
                     continue
                 low = line.lower()
+                # Lazy %-formatting: DEBUG lines are dropped without building a message
                 if 'error' in low:
-                    self.session_logger.error(f"ffmpeg {line}")
+                    self.session_logger.error("ffmpeg %s", line)
                 elif 'warn' in low:
-                    self.session_logger.warning(f"ffmpeg {line}")
+                    self.session_logger.warning("ffmpeg %s", line)
                 else:
                     # Only visible if logger level allows DEBUG
-                    self.session_logger.debug(f"ffmpeg {line}")
+                    self.session_logger.debug("ffmpeg %s", line)
         except Exception as e:
             try:
                 self.session_logger.warning(f"stderr reader exception err={e}")
@@ -550,38 +556,37 @@ class EchologRecorder:
         chunk_index_re = re.compile(r"_chunk_(\d{3})\.")
         try:
             while self.recording:
-                files = sorted(session_dir.glob(pattern))
-                for f in files:
-                    name = f.name
-                    if name not in self._known_chunks:
-                        # First time seeing this chunk: creation
+                # Only sort and process names not seen before; steady-state ticks are a set difference
+                new_names = {f.name for f in session_dir.glob(pattern)} - self._known_chunks
+                for name in sorted(new_names):
+                    # First time seeing this chunk: creation
+                    try:
+                        size = (session_dir / name).stat().st_size
+                    except FileNotFoundError:
+                        size = 0
+                    self._known_chunks.add(name)
+                    if self.session_logger:
+                        self.session_logger.info(f"chunk created file={name} size={size}B")
+
+                    # Attempt to finalize previous chunk if applicable
+                    m = chunk_index_re.search(name)
+                    if m:
                         try:
-                            size = f.stat().st_size
-                        except FileNotFoundError:
-                            size = 0
-                        self._known_chunks.add(name)
-                        if self.session_logger:
-                            self.session_logger.info(f"chunk created file={name} size={size}B")
-
-                        # Attempt to finalize previous chunk if applicable
-                        m = chunk_index_re.search(name)
-                        if m:
-                            try:
-                                cur_idx = int(m.group(1))
-                            except ValueError:
-                                cur_idx = None
-                            if cur_idx is not None and cur_idx > 0:
-                                prev_name = name.replace(f"_chunk_{cur_idx:03d}.", f"_chunk_{cur_idx-1:03d}.")
-                                if prev_name not in self._finalized_chunks:
-                                    prev_path = session_dir / prev_name
-                                    if prev_path.exists():
-                                        try:
-                                            final_size = prev_path.stat().st_size
-                                        except FileNotFoundError:
-                                            final_size = 0
-                                        if self.session_logger:
-                                            self.session_logger.info(f"chunk finalized file={prev_name} size={final_size}B")
-                                        self._finalized_chunks.add(prev_name)
+                            cur_idx = int(m.group(1))
+                        except ValueError:
+                            cur_idx = None
+                        if cur_idx is not None and cur_idx > 0:
+                            prev_name = name.replace(f"_chunk_{cur_idx:03d}.", f"_chunk_{cur_idx-1:03d}.")
+                            if prev_name not in self._finalized_chunks:
+                                prev_path = session_dir / prev_name
+                                if prev_path.exists():
+                                    try:
+                                        final_size = prev_path.stat().st_size
+                                    except FileNotFoundError:
+                                        final_size = 0
+                                    if self.session_logger:
+                                        self.session_logger.info(f"chunk finalized file={prev_name} size={final_size}B")
+                                    self._finalized_chunks.add(prev_name)
                 time.sleep(min(2, max(1, segment_duration // 10)))
         except Exception as e:
             if self.session_logger:
@@ -620,11 +625,13 @@ class EchologRecorder:
             # Log stop summary
             try:
                 if self.session_logger:
-                    # Finalize the last chunk size if not already
+                    # Snapshot this session's chunks once for both finalization and the summary
+                    all_chunks: List[Path] = []
                     try:
                         output_dir = os.path.expanduser(self.config.get('recording', 'output_dir'))
                         session_dir = Path(output_dir) / self.session_id.split('_')[0]
                         all_chunks = sorted(session_dir.glob(f"{self.session_id.split('_')[0]}_*_chunk_*.{self.config.get('recording', 'format', fallback='ogg')}"))
+                        # Finalize the last chunk size if not already
                         if all_chunks:
                             last = all_chunks[-1].name
                             if last not in self._finalized_chunks:
@@ -633,11 +640,7 @@ class EchologRecorder:
                                 self._finalized_chunks.add(last)
                     except Exception:
                         pass
-                    # Count chunks for this session
-                    output_dir = os.path.expanduser(self.config.get('recording', 'output_dir'))
-                    session_dir = Path(output_dir) / self.session_id.split('_')[0]
-                    files = list(session_dir.glob(f"{self.session_id.split('_')[0]}_*_chunk_*.{self.config.get('recording', 'format', fallback='ogg')}"))
-                    count = len(files)
+                    count = len(all_chunks)
                     duration_s = 0.0
                     if self._recording_start_monotonic is not None:
                         duration_s = max(0.0, time.monotonic() - self._recording_start_monotonic)